@@ -12,6 +12,22 @@ export const DISCORD_MESSAGE_LIMIT = 2000;
 export const DISCORD_EMBED_FIELDS_LIMIT = 25;
 export const DISCORD_EMBED_FIELD_VALUE_LIMIT = 1024;
 export const DISCORD_EMBED_TOTAL_CHARS_LIMIT = 6000;
+export const DISCORD_EMBEDS_PER_MESSAGE_LIMIT = 10;
+
+// HTTP client settings for Discord webhook requests
+export const HTTP_TIMEOUT_MS = 30000;
+
+// Discord allows roughly 5 requests per 2 seconds per webhook
+export const WEBHOOK_RATE_LIMIT_REQUESTS = 5;
+export const WEBHOOK_RATE_LIMIT_WINDOW_MS = 2000;
+
+// Retries for 429 and 5xx responses
+export const WEBHOOK_MAX_RETRIES = 3;
+export const WEBHOOK_RETRY_BASE_DELAY_MS = 1000;
+export const WEBHOOK_RETRY_JITTER_MS = 1000;
+export const WEBHOOK_MAX_RETRY_DELAY_MS = 10000;
+// Identical sends to the same webhook within this window are suppressed
+export const WEBHOOK_DEDUPE_WINDOW_MS = 5000;
 
 export const CONFIG_DIR = process.env.DISCORD_MCP_CONFIG_DIR || 
   join(homedir(), '.config', 'discord_mcp');
@@ -16,6 +16,7 @@ import {
 // Import tool handlers
 import { handleSendMessage } from './tools/sendMessage.js';
 import { handleSendAnnouncement } from './tools/sendAnnouncement.js';
+import { handleSendAnnouncementBatch } from './tools/sendAnnouncementBatch.js';
 import { handleSendTeaser } from './tools/sendTeaser.js';
 import { handleSendChangelog } from './tools/sendChangelog.js';
 import { handleAddWebhook } from './tools/addWebhook.js';
@@ -62,6 +63,10 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
             enum: ['markdown', 'json'],
             description: 'Output format for the response (default: markdown)',
           },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
         },
         required: ['content'],
       },
@@ -123,10 +128,85 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
             enum: ['markdown', 'json'],
             description: 'Output format for the response (default: markdown)',
           },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
         },
         required: ['version', 'headline', 'changes'],
       },
     },
+    {
+      name: 'discord_send_announcement_batch',
+      description: 'Send up to 10 release announcements to Discord as rich embeds, packed into as few messages as Discord limits allow (10 embeds and 6000 characters per message). Use this instead of repeated discord_send_announcement calls when announcing several releases at once. Automatically uses the "releases" webhook.',
+      inputSchema: {
+        type: 'object',
+        properties: {
+          announcements: {
+            type: 'array',
+            description: 'Announcements to send (1-10 items)',
+            items: {
+              type: 'object',
+              properties: {
+                version: {
+                  type: 'string',
+                  description: 'Version number (e.g., "v2.6.0-beta", "1.0.0")',
+                },
+                headline: {
+                  type: 'string',
+                  description: 'Main headline/feature announcement (max 256 characters)',
+                },
+                changes: {
+                  type: 'array',
+                  items: { type: 'string' },
+                  description: 'List of changes/features to highlight (1-10 items)',
+                },
+                downloadUrl: {
+                  type: 'string',
+                  description: 'Optional: URL to download/learn more',
+                },
+                style: {
+                  type: 'string',
+                  enum: ['release', 'hotfix', 'beta', 'custom'],
+                  description: 'Announcement style: release (green), hotfix (red), beta (yellow), custom (blue)',
+                },
+                betaWarning: {
+                  type: 'boolean',
+                  description: 'Include beta warning message (default: false)',
+                },
+                embedColor: {
+                  type: 'string',
+                  description: 'Optional: Custom hex color for embed (e.g., "#5865F2")',
+                },
+                thumbnailUrl: {
+                  type: 'string',
+                  description: 'Optional: URL for thumbnail image in embed',
+                },
+                footerText: {
+                  type: 'string',
+                  description: 'Optional: Custom footer text',
+                },
+              },
+              required: ['version', 'headline', 'changes'],
+            },
+          },
+          username: {
+            type: 'string',
+            description: 'Optional: Override webhook username for these messages',
+          },
+          responseFormat: {
+            type: 'string',
+            enum: ['markdown', 'json'],
+            description: 'Output format for the response (default: markdown)',
+          },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
+        },
+        required: ['announcements'],
+      },
+    },
     {
       name: 'discord_send_teaser',
       description: 'Send a teaser/preview announcement to Discord. Perfect for "coming soon" announcements and sneak peeks of upcoming features. Automatically uses the "teasers" webhook.',
@@ -172,6 +252,10 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
             enum: ['markdown', 'json'],
             description: 'Output format for the response (default: markdown)',
           },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
         },
         required: ['version', 'headline', 'highlights'],
       },
@@ -244,6 +328,10 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
             enum: ['markdown', 'json'],
             description: 'Output format for the response (default: markdown)',
           },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
         },
         required: ['title', 'sections'],
       },
@@ -295,6 +383,10 @@ server.setRequestHandler(ListToolsRequestSchema, async () => ({
             enum: ['markdown', 'json'],
             description: 'Output format for the response (default: markdown)',
           },
+          pretty: {
+            type: 'boolean',
+            description: 'Indent JSON responses for readability (default: false, compact)',
+          },
         },
       },
     },
@@ -317,6 +409,10 @@ server.setRequestHandler(CallToolRequestSchema, async (request) => {
         result = await handleSendAnnouncement(args);
         break;
       
+      case 'discord_send_announcement_batch':
+        result = await handleSendAnnouncementBatch(args);
+        break;
+      
       case 'discord_send_teaser':
         result = await handleSendTeaser(args);
         break;
@@ -361,7 +457,7 @@ async function main() {
   // Log to stderr (stdout is reserved for MCP protocol)
   console.error('Discord MCP Server v2.0.0 running on stdio');
   console.error('Server name: discord');
-  console.error('Tools: 7 (send_message, send_announcement, send_teaser, send_changelog, add_webhook, remove_webhook, list_webhooks)');
+  console.error('Tools: 8 (send_message, send_announcement, send_announcement_batch, send_teaser, send_changelog, add_webhook, remove_webhook, list_webhooks)');
 }
 
 // Error handling for startup
@@ -13,43 +13,34 @@ export async function handleListWebhooks(params: unknown): Promise<string> {
     
     // 2. Load webhooks
     const webhooks = await loadWebhooks();
+    const entries = Object.entries(webhooks);
     
-    if (Object.keys(webhooks).length === 0) {
+    if (entries.length === 0) {
       return 'No webhooks configured. Use add_webhook to add one.';
     }
     
     if (validated.responseFormat === ResponseFormat.JSON) {
       // Return sanitized data (hide full URLs)
       const sanitized: Record<string, unknown> = {};
-      for (const [name, config] of Object.entries(webhooks)) {
-        const url = config.url || '';
-        // Show only last 8 chars of webhook URL for identification
-        const urlHint = url.length > 8 ? `...${url.slice(-8)}` : url;
+      for (const [name, config] of entries) {
         sanitized[name] = {
           description: config.description,
-          url_hint: urlHint,
+          url_hint: urlHint(config.url),
           added_at: config.added_at,
         };
       }
-      return JSON.stringify(sanitized, null, 2);
+      return JSON.stringify(sanitized, null, validated.pretty ? 2 : undefined);
     }
     
-    // Markdown format
-    const lines = ['# Configured Discord Webhooks', ''];
-    for (const [name, config] of Object.entries(webhooks)) {
-      const url = config.url || '';
-      const urlHint = url.length > 8 ? `...${url.slice(-8)}` : url;
-      const desc = config.description || 'No description';
-      const added = config.added_at || 'Unknown';
-      
-      lines.push(`## ${name}`);
-      lines.push(`- **Description**: ${desc}`);
-      lines.push(`- **URL hint**: \`${urlHint}\``);
-      lines.push(`- **Added**: ${added}`);
-      lines.push('');
-    }
+    // Markdown format: one block per webhook, joined once
+    const sections = entries.map(([name, config]) =>
+      `## ${name}\n` +
+      `- **Description**: ${config.description || 'No description'}\n` +
+      `- **URL hint**: \`${urlHint(config.url)}\`\n` +
+      `- **Added**: ${config.added_at || 'Unknown'}\n`
+    );
     
-    return lines.join('\n');
+    return ['# Configured Discord Webhooks', '', ...sections].join('\n');
   } catch (error) {
     if (error instanceof Error) {
       return `Error: Failed to list webhooks: ${error.message}`;
@@ -57,3 +48,9 @@ export async function handleListWebhooks(params: unknown): Promise<string> {
     return `Error: Failed to list webhooks: ${String(error)}`;
   }
 }
+
+// Show only last 8 chars of webhook URL for identification
+function urlHint(url: string | undefined): string {
+  const value = url || '';
+  return value.length > 8 ? `...${value.slice(-8)}` : value;
+}
@@ -13,8 +13,7 @@ export async function handleRemoveWebhook(params: unknown): Promise<string> {
     // 2. Load webhooks
     const webhooks = await loadWebhooks();
     
-    const nameLower = validated.name.toLowerCase();
-    if (!(nameLower in webhooks)) {
+    if (!Object.hasOwn(webhooks, validated.name)) {
       const available = Object.keys(webhooks);
       if (available.length > 0) {
         return `Error: Webhook '${validated.name}' not found. Available webhooks: ${available.join(', ')}`;
@@ -23,7 +22,7 @@ export async function handleRemoveWebhook(params: unknown): Promise<string> {
     }
     
     // 3. Remove webhook
-    delete webhooks[nameLower];
+    delete webhooks[validated.name];
     await saveWebhooks(webhooks);
     
     return `Webhook '${validated.name}' removed successfully.`;
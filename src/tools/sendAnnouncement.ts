@@ -4,10 +4,16 @@
 
 import { sendAnnouncementInputSchema } from '../types/schemas.js';
 import { ResponseFormat } from '../types/enums.js';
-import { DISCORD_MESSAGE_LIMIT, LIVING_LANDS_LOGO_URL } from '../constants.js';
-import { getWebhookUrl, loadWebhooks } from '../utils/storage.js';
+import { DISCORD_MESSAGE_LIMIT } from '../constants.js';
+import { resolveWebhookUrl } from '../utils/storage.js';
 import { sendWebhookMessage } from '../utils/webhook.js';
-import { buildAnnouncementEmbed, formatAnnouncement } from '../utils/embed.js';
+import {
+  buildAnnouncementEmbed,
+  describeEmbedLimitViolation,
+  formatAnnouncement,
+  formatEmbedPreview,
+  measureAnnouncement,
+} from '../utils/embed.js';
 import { handleError } from '../utils/errors.js';
 
 export async function handleSendAnnouncement(params: unknown): Promise<string> {
@@ -17,86 +23,54 @@ export async function handleSendAnnouncement(params: unknown): Promise<string> {
     const webhookName = 'releases';
     
     // 2. Get webhook URL
-    const webhookUrl = await getWebhookUrl(webhookName);
-    if (!webhookUrl) {
-      const webhooks = await loadWebhooks();
-      const available = Object.keys(webhooks);
-      if (available.length > 0) {
-        return `Error: Webhook '${webhookName}' not found. Available webhooks: ${available.join(', ')}. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-      }
-      return `Error: Webhook '${webhookName}' not found. No webhooks configured. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-    }
+    const webhookUrl = await resolveWebhookUrl(webhookName);
     
     if (validated.useEmbed) {
       // Build rich embed
-      const thumbnail = validated.thumbnailUrl || LIVING_LANDS_LOGO_URL;
-      
-      const embed = buildAnnouncementEmbed({
-        version: validated.version,
-        headline: validated.headline,
-        changes: validated.changes,
-        downloadUrl: validated.downloadUrl,
-        style: validated.style,
-        betaWarning: validated.betaWarning,
-        embedColor: validated.embedColor,
-        thumbnailUrl: thumbnail,
-        footerText: validated.footerText,
-      });
+      const embed = buildAnnouncementEmbed(validated);
+      const problem = describeEmbedLimitViolation(embed);
+      if (problem) {
+        return `Error: ${problem}`;
+      }
       
       // Send with embed
       const result = await sendWebhookMessage(webhookUrl, {
         embeds: [embed],
         username: validated.username,
-      });
+      }, { dedupe: true });
       
       if (validated.responseFormat === ResponseFormat.JSON) {
         return JSON.stringify({
           result,
           embed,
           format: 'embed',
-        }, null, 2);
+        }, null, validated.pretty ? 2 : undefined);
+      }
+      
+      if (result.deduped) {
+        return `Duplicate announcement suppressed. ${result.message}`;
       }
       
       if (result.success) {
-        // Build preview text
-        const previewLines = [
-          `**${embed.title}**`,
-          embed.description,
-          '',
-        ];
-        
-        for (const field of embed.fields ?? []) {
-          previewLines.push(`**${field.name}**`);
-          previewLines.push(field.value);
-          previewLines.push('');
-        }
-        
-        const preview = previewLines.join('\n');
+        const preview = formatEmbedPreview(embed);
         return `Embed announcement sent successfully!\n\n**Preview:**\n${preview}`;
       } else {
         return `Error: Failed to send announcement. ${result.error ?? 'Unknown error'}`;
       }
     } else {
-      // Use plain text format
-      const announcement = formatAnnouncement({
-        version: validated.version,
-        headline: validated.headline,
-        changes: validated.changes,
-        downloadUrl: validated.downloadUrl,
-        style: validated.style,
-        betaWarning: validated.betaWarning,
-      });
-      
-      // Check Discord message limit
-      if (announcement.length > DISCORD_MESSAGE_LIMIT) {
-        return `Error: Announcement is too long (${announcement.length} chars). Discord limit is ${DISCORD_MESSAGE_LIMIT} characters. Reduce the number of changes or shorten descriptions.`;
+      // Use plain text format; check Discord message limit before building it
+      const length = measureAnnouncement(validated);
+      if (length > DISCORD_MESSAGE_LIMIT) {
+        return `Error: Announcement is too long (${length} chars). Discord limit is ${DISCORD_MESSAGE_LIMIT} characters. Reduce the number of changes or shorten descriptions.`;
       }
       
+      const announcement = formatAnnouncement(validated);
+      
       // Send message
       const result = await sendWebhookMessage(webhookUrl, {
         content: announcement,
         username: validated.username,
-      });
+      }, { dedupe: true });
       
       if (validated.responseFormat === ResponseFormat.JSON) {
         return JSON.stringify({
@@ -104,7 +78,11 @@ export async function handleSendAnnouncement(params: unknown): Promise<string> {
           announcement_preview: announcement,
           character_count: announcement.length,
           format: 'plain_text',
-        }, null, 2);
+        }, null, validated.pretty ? 2 : undefined);
+      }
+      
+      if (result.deduped) {
+        return `Duplicate announcement suppressed. ${result.message}`;
       }
       
       if (result.success) {
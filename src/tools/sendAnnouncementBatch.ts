@@ -0,0 +1,84 @@
+/**
+ * Send Announcement Batch Tool - Send several release announcements as embeds
+ * in as few webhook requests as Discord allows
+ */
+
+import { sendAnnouncementBatchInputSchema } from '../types/schemas.js';
+import { ResponseFormat } from '../types/enums.js';
+import type { WebhookResponse } from '../types/interfaces.js';
+import { resolveWebhookUrl } from '../utils/storage.js';
+import { sendWebhookMessage } from '../utils/webhook.js';
+import {
+  buildAnnouncementEmbed,
+  describeEmbedLimitViolation,
+  formatEmbedPreview,
+  groupEmbedsForMessages,
+} from '../utils/embed.js';
+import { handleError } from '../utils/errors.js';
+
+export async function handleSendAnnouncementBatch(params: unknown): Promise<string> {
+  try {
+    // 1. Validate input
+    const validated = sendAnnouncementBatchInputSchema.parse(params);
+    const webhookName = 'releases';
+
+    // 2. Get webhook URL
+    const webhookUrl = await resolveWebhookUrl(webhookName);
+
+    // 3. Build one embed per announcement, all sharing a timestamp
+    const timestamp = new Date().toISOString();
+    const embeds = validated.announcements.map(announcement =>
+      buildAnnouncementEmbed({ ...announcement, timestamp })
+    );
+    // Reject the whole batch before sending anything Discord would refuse
+    for (const [index, embed] of embeds.entries()) {
+      const problem = describeEmbedLimitViolation(embed);
+      if (problem) {
+        return `Error: Announcement ${index + 1} (${validated.announcements[index].version}): ${problem}`;
+      }
+    }
+
+    // 4. Send each group as a single message; stop at the first failure
+    const messages = groupEmbedsForMessages(embeds);
+    const results: WebhookResponse[] = [];
+    for (const group of messages) {
+      const result = await sendWebhookMessage(webhookUrl, {
+        embeds: group,
+        username: validated.username,
+      }, { dedupe: true });
+      results.push(result);
+      if (!result.success) break;
+    }
+
+    const failed = results.find(result => !result.success);
+
+    if (validated.responseFormat === ResponseFormat.JSON) {
+      return JSON.stringify({
+        results,
+        embeds,
+        messages: messages.length,
+        format: 'embed_batch',
+      }, null, validated.pretty ? 2 : undefined);
+    }
+
+    if (failed) {
+      const sent = messages
+        .slice(0, results.length - 1)
+        .reduce((count, group) => count + group.length, 0);
+      return `Error: Failed to send announcements (${sent} of ${embeds.length} sent). ${failed.error ?? 'Unknown error'}`;
+    }
+
+    const deduped = results.filter(result => result.deduped).length;
+    if (deduped === results.length) {
+      return `Duplicate announcements suppressed. ${results[0].message}`;
+    }
+    
+    const previews = embeds.map(embed => formatEmbedPreview(embed)).join('\n\n---\n\n');
+    const note = deduped > 0
+      ? `\n\n${deduped} of ${messages.length} message(s) were identical to ones sent in the last few seconds and were not posted again.`
+      : '';
+    return `${embeds.length} announcement(s) sent successfully in ${messages.length} message(s)!${note}\n\n**Preview:**\n${previews}`;
+  } catch (error) {
+    return handleError(error);
+  }
+}
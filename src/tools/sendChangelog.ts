@@ -4,8 +4,8 @@
 
 import { sendChangelogInputSchema } from '../types/schemas.js';
 import { ResponseFormat } from '../types/enums.js';
-import { DISCORD_MESSAGE_LIMIT, LIVING_LANDS_LOGO_URL } from '../constants.js';
-import { getWebhookUrl, loadWebhooks } from '../utils/storage.js';
+import { DISCORD_MESSAGE_LIMIT } from '../constants.js';
+import { resolveWebhookUrl } from '../utils/storage.js';
 import { sendWebhookMessage } from '../utils/webhook.js';
 import { buildChangelogEmbed, formatChangelog } from '../utils/embed.js';
 import { handleError } from '../utils/errors.js';
@@ -15,52 +15,30 @@ export async function handleSendChangelog(params: unknown): Promise<string> {
     const validated = sendChangelogInputSchema.parse(params);
     const webhookName = 'changelog';
 
-    const webhookUrl = await getWebhookUrl(webhookName);
-    if (!webhookUrl) {
-      const webhooks = await loadWebhooks();
-      const available = Object.keys(webhooks);
-      if (available.length > 0) {
-        return `Error: Webhook '${webhookName}' not found. Available webhooks: ${available.join(', ')}. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-      }
-      return `Error: Webhook '${webhookName}' not found. No webhooks configured. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-    }
+    const webhookUrl = await resolveWebhookUrl(webhookName);
 
     if (validated.useEmbed) {
-      const thumbnail = validated.thumbnailUrl || LIVING_LANDS_LOGO_URL;
-      const embed = buildChangelogEmbed({
-        title: validated.title,
-        sections: validated.sections,
-        version: validated.version,
-        summary: validated.summary,
-        url: validated.url,
-        style: validated.style,
-        embedColor: validated.embedColor,
-        thumbnailUrl: thumbnail,
-        footerText: validated.footerText,
-      });
+      const embed = buildChangelogEmbed(validated);
 
       const result = await sendWebhookMessage(webhookUrl, {
         embeds: [embed],
         username: validated.username,
-      });
+      }, { dedupe: true });
 
       if (validated.responseFormat === ResponseFormat.JSON) {
-        return JSON.stringify({ result, embed, format: 'changelog_embed' }, null, 2);
+        return JSON.stringify({ result, embed, format: 'changelog_embed' }, null, validated.pretty ? 2 : undefined);
       }
 
+      if (result.deduped) {
+        return `Duplicate changelog suppressed. ${result.message}`;
+      }
       if (result.success) {
         return `Changelog sent successfully!`;
       }
       return `Error: Failed to send changelog. ${result.error ?? 'Unknown error'}`;
     }
 
-    const message = formatChangelog({
-      title: validated.title,
-      sections: validated.sections,
-      version: validated.version,
-      summary: validated.summary,
-      url: validated.url,
-    });
+    const message = formatChangelog(validated);
 
     if (message.length > DISCORD_MESSAGE_LIMIT) {
       return `Error: Changelog is too long (${message.length} chars). Discord limit is ${DISCORD_MESSAGE_LIMIT} characters. Reduce sections/items or shorten text.`;
@@ -69,7 +47,7 @@ export async function handleSendChangelog(params: unknown): Promise<string> {
     const result = await sendWebhookMessage(webhookUrl, {
       content: message,
       username: validated.username,
-    });
+    }, { dedupe: true });
 
     if (validated.responseFormat === ResponseFormat.JSON) {
       return JSON.stringify(
@@ -80,10 +58,13 @@ export async function handleSendChangelog(params: unknown): Promise<string> {
           format: 'plain_text',
         },
         null,
-        2
+        validated.pretty ? 2 : undefined
       );
     }
 
+    if (result.deduped) {
+      return `Duplicate changelog suppressed. ${result.message}`;
+    }
     return result.success
       ? `Changelog sent successfully!\n\n**Preview:**\n\`\`\`\n${message}\n\`\`\``
       : `Error: Failed to send changelog. ${result.error ?? 'Unknown error'}`;
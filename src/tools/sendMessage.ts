@@ -4,7 +4,7 @@
 
 import { sendMessageInputSchema } from '../types/schemas.js';
 import { ResponseFormat } from '../types/enums.js';
-import { getWebhookUrl, loadWebhooks } from '../utils/storage.js';
+import { resolveWebhookUrl } from '../utils/storage.js';
 import { sendWebhookMessage } from '../utils/webhook.js';
 import { handleError } from '../utils/errors.js';
 
@@ -15,15 +15,7 @@ export async function handleSendMessage(params: unknown): Promise<string> {
     const webhookName = 'messages';
     
     // 2. Get webhook URL
-    const webhookUrl = await getWebhookUrl(webhookName);
-    if (!webhookUrl) {
-      const webhooks = await loadWebhooks();
-      const available = Object.keys(webhooks);
-      if (available.length > 0) {
-        return `Error: Webhook '${webhookName}' not found. Available webhooks: ${available.join(', ')}. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-      }
-      return `Error: Webhook '${webhookName}' not found. No webhooks configured. Use discord_add_webhook to add a webhook named '${webhookName}'.`;
-    }
+    const webhookUrl = await resolveWebhookUrl(webhookName);
     
     // 3. Send message
     const result = await sendWebhookMessage(webhookUrl, {
@@ -34,7 +26,7 @@ export async function handleSendMessage(params: unknown): Promise<string> {
     
     // 4. Format response
     if (validated.responseFormat === ResponseFormat.JSON) {
-      return JSON.stringify(result, null, 2);
+      return JSON.stringify(result, null, validated.pretty ? 2 : undefined);
     }
     
     return result.success
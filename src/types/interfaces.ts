@@ -4,17 +4,59 @@
 
 import { z } from 'zod';
 import * as schemas from './schemas.js';
+import type { AnnouncementStyle } from './enums.js';
 
 // Infer TypeScript types from Zod schemas
 export type WebhookConfig = z.infer<typeof schemas.webhookConfigSchema>;
 export type SendMessageInput = z.infer<typeof schemas.sendMessageInputSchema>;
 export type SendAnnouncementInput = z.infer<typeof schemas.sendAnnouncementInputSchema>;
+export type SendAnnouncementBatchInput = z.infer<typeof schemas.sendAnnouncementBatchInputSchema>;
 export type SendTeaserInput = z.infer<typeof schemas.sendTeaserInputSchema>;
 export type SendChangelogInput = z.infer<typeof schemas.sendChangelogInputSchema>;
 export type AddWebhookInput = z.infer<typeof schemas.addWebhookInputSchema>;
 export type RemoveWebhookInput = z.infer<typeof schemas.removeWebhookInputSchema>;
 export type ListWebhooksInput = z.infer<typeof schemas.listWebhooksInputSchema>;
 
+// Builder inputs. Validated tool inputs satisfy these structurally, so tools
+// pass them straight through instead of re-packing fields.
+export interface AnnouncementContent {
+  version: string;
+  headline: string;
+  changes: string[];
+  downloadUrl?: string;
+  style: AnnouncementStyle;
+  betaWarning: boolean;
+  embedColor?: number;
+  thumbnailUrl?: string;
+  footerText?: string;
+  timestamp?: string;
+}
+
+export interface TeaserContent {
+  version: string;
+  headline: string;
+  highlights: string[];
+  additionalInfo?: string;
+  style: AnnouncementStyle;
+  embedColor?: number;
+  thumbnailUrl?: string;
+  footerText?: string;
+  timestamp?: string;
+}
+
+export interface ChangelogContent {
+  title: string;
+  sections: Array<{ title: string; items: string[] }>;
+  version?: string;
+  summary?: string;
+  url?: string;
+  style: AnnouncementStyle;
+  embedColor?: number;
+  thumbnailUrl?: string;
+  footerText?: string;
+  timestamp?: string;
+}
+
 // Discord API types
 export interface DiscordEmbed {
   title?: string;
@@ -33,6 +75,8 @@ export interface DiscordEmbedField {
   inline?: boolean;
 }
 
+// Optional keys may be passed as undefined; JSON.stringify omits them, so no
+// filtering pass is needed before sending
 export interface WebhookMessagePayload {
   content?: string;
   username?: string;
@@ -46,6 +90,7 @@ export interface WebhookResponse {
   message?: string;
   error?: string;
   response?: unknown;
+  deduped?: boolean;  // true when an identical recent send made this one a no-op
 }
 
 export interface WebhookStorage {
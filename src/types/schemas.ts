@@ -5,17 +5,56 @@
 
 import { z } from 'zod';
 import { ResponseFormat, AnnouncementStyle } from './enums.js';
+import {
+  DISCORD_EMBED_FIELD_VALUE_LIMIT,
+  DISCORD_EMBEDS_PER_MESSAGE_LIMIT,
+  DISCORD_MESSAGE_LIMIT,
+} from '../constants.js';
 
-// Webhook URL validator
+// Accepted webhook URL prefixes, matched in a single anchored test
+const WEBHOOK_URL_PREFIX = /^https:\/\/(?:discord|discordapp)\.com\/api\/webhooks\//;
+
+// Webhook URL validator (shared by webhookConfigSchema and addWebhookInputSchema)
 const webhookUrlSchema = z.string()
   .min(50)
   .max(300)
   .refine(
-    (url) => url.startsWith('https://discord.com/api/webhooks/') || 
-             url.startsWith('https://discordapp.com/api/webhooks/'),
+    (url) => WEBHOOK_URL_PREFIX.test(url),
     { message: 'Invalid Discord webhook URL. Must start with \'https://discord.com/api/webhooks/\' or \'https://discordapp.com/api/webhooks/\'' }
   );
 
+// Webhook names are stored lowercase with underscores; add and remove share
+// this normalization so both resolve to the same storage key
+const webhookNameSchema = z.string()
+  .trim()
+  .min(1)
+  .max(50)
+  .transform((name) => name.toLowerCase().replace(/\s+/g, '_'));
+
+// Shared field schemas, built once and reused across the tool input schemas
+const versionSchema = z.string().trim().min(1).max(30);
+const titleSchema = z.string().trim().min(1).max(256);
+// List items are stored without a leading "->" or "→"; builders add their own
+// bullet, so the send path never has to re-scan the strings. An item longer
+// than an embed field could never be sent as one.
+const bulletItemSchema = z.string().max(DISCORD_EMBED_FIELD_VALUE_LIMIT).transform((item) => {
+  const body = item.startsWith('->') ? item.slice(2)
+    : item.startsWith('→') ? item.slice(1)
+    : item;
+  return body.trimStart();
+});
+const bulletListSchema = z.array(bulletItemSchema).min(1).max(10);
+// "#RRGGBB" parsed once into the decimal color value Discord expects
+const hexColorSchema = z.string()
+  .regex(/^#[0-9A-Fa-f]{6}$/)
+  .transform((hex) => parseInt(hex.slice(1), 16));
+const footerTextSchema = z.string().max(100);
+const usernameSchema = z.string().max(80);
+const linkUrlSchema = z.string().url();
+const responseFormatSchema = z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN);
+// JSON responses are compact unless the caller asks for indented output
+const prettySchema = z.boolean().default(false);
+
 // Webhook Configuration
 export const webhookConfigSchema = z.object({
   name: z.string().min(1).max(50),
@@ -24,69 +63,87 @@ export const webhookConfigSchema = z.object({
   added_at: z.string().datetime(),  // snake_case for Python compatibility
 });
 
-// Tool Input Schemas
-export const sendMessageInputSchema = z.object({
-  content: z.string().min(1).max(2000),
-  username: z.string().max(80).optional(),
-  avatarUrl: z.string().url().optional(),
-  responseFormat: z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN),
+// Tool Input Schemas (strict: unknown keys are rejected instead of silently dropped)
+export const sendMessageInputSchema = z.strictObject({
+  content: z.string().min(1).max(DISCORD_MESSAGE_LIMIT),
+  username: usernameSchema.optional(),
+  avatarUrl: linkUrlSchema.optional(),
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
 });
 
-export const sendAnnouncementInputSchema = z.object({
-  version: z.string().min(1).max(30),
-  headline: z.string().min(1).max(256),
-  changes: z.array(z.string()).min(1).max(10),
-  downloadUrl: z.string().url().optional(),
+// Announcement content shared by the single and batch announcement tools
+const announcementContentShape = {
+  version: versionSchema,
+  headline: titleSchema,
+  changes: bulletListSchema,
+  downloadUrl: linkUrlSchema.optional(),
   style: z.nativeEnum(AnnouncementStyle).default(AnnouncementStyle.RELEASE),
   betaWarning: z.boolean().default(false),
+  embedColor: hexColorSchema.optional(),
+  thumbnailUrl: linkUrlSchema.optional(),
+  footerText: footerTextSchema.optional(),
+};
+
+// Rendered lengths (plain-text message, embed fields and totals) are checked by
+// the tools against the message or embed they build, before it is sent
+export const sendAnnouncementInputSchema = z.strictObject({
+  ...announcementContentShape,
   useEmbed: z.boolean().default(true),
-  embedColor: z.string().regex(/^#[0-9A-Fa-f]{6}$/).optional(),
-  thumbnailUrl: z.string().url().optional(),
-  footerText: z.string().max(100).optional(),
-  username: z.string().max(80).optional(),
-  responseFormat: z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN),
+  username: usernameSchema.optional(),
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
 });
 
-export const sendTeaserInputSchema = z.object({
-  version: z.string().min(1).max(30),
-  headline: z.string().min(1).max(256),
-  highlights: z.array(z.string()).min(1).max(10),
+export const sendAnnouncementBatchInputSchema = z.strictObject({
+  announcements: z
+    .array(z.strictObject(announcementContentShape))
+    .min(1)
+    .max(DISCORD_EMBEDS_PER_MESSAGE_LIMIT),
+  username: usernameSchema.optional(),
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
+});
+
+export const sendTeaserInputSchema = z.strictObject({
+  version: versionSchema,
+  headline: titleSchema,
+  highlights: bulletListSchema,
   additionalInfo: z.string().max(500).optional(),
   style: z.nativeEnum(AnnouncementStyle).default(AnnouncementStyle.CUSTOM),
-  thumbnailUrl: z.string().url().optional(),
-  footerText: z.string().max(100).optional(),
-  username: z.string().max(80).optional(),
-  responseFormat: z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN),
+  thumbnailUrl: linkUrlSchema.optional(),
+  footerText: footerTextSchema.optional(),
+  username: usernameSchema.optional(),
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
 });
 
-export const sendChangelogInputSchema = z.object({
-  title: z.string().min(1).max(256),
+export const sendChangelogInputSchema = z.strictObject({
+  title: titleSchema,
   sections: z
     .array(
-      z.object({
-        title: z.string().min(1).max(256),
+      z.strictObject({
+        title: titleSchema,
         items: z.array(z.string()).min(1).max(25),
       })
     )
     .min(1)
     .max(25),
-  version: z.string().min(1).max(30).optional(),
+  version: versionSchema.optional(),
   summary: z.string().max(2000).optional(),
-  url: z.string().url().optional(),
+  url: linkUrlSchema.optional(),
   style: z.nativeEnum(AnnouncementStyle).default(AnnouncementStyle.RELEASE),
   useEmbed: z.boolean().default(true),
-  embedColor: z.string().regex(/^#[0-9A-Fa-f]{6}$/).optional(),
-  thumbnailUrl: z.string().url().optional(),
-  footerText: z.string().max(100).optional(),
-  username: z.string().max(80).optional(),
-  responseFormat: z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN),
+  embedColor: hexColorSchema.optional(),
+  thumbnailUrl: linkUrlSchema.optional(),
+  footerText: footerTextSchema.optional(),
+  username: usernameSchema.optional(),
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
 });
 
-export const addWebhookInputSchema = z.object({
-  name: z.string()
-    .min(1)
-    .max(50)
-    .transform((name) => name.toLowerCase().replace(/\s+/g, '_'))
+export const addWebhookInputSchema = z.strictObject({
+  name: webhookNameSchema
     .refine(
       (name) => /^[a-z0-9_]+$/.test(name),
       { message: 'Webhook name must contain only alphanumeric characters and underscores' }
@@ -95,10 +152,11 @@ export const addWebhookInputSchema = z.object({
   description: z.string().max(200).optional(),
 });
 
-export const removeWebhookInputSchema = z.object({
-  name: z.string().min(1).max(50),
+export const removeWebhookInputSchema = z.strictObject({
+  name: webhookNameSchema,
 });
 
-export const listWebhooksInputSchema = z.object({
-  responseFormat: z.nativeEnum(ResponseFormat).default(ResponseFormat.MARKDOWN),
+export const listWebhooksInputSchema = z.strictObject({
+  responseFormat: responseFormatSchema,
+  pretty: prettySchema,
 });
@@ -7,71 +7,78 @@ import {
   DISCORD_EMBED_FIELD_VALUE_LIMIT,
   DISCORD_EMBED_FIELDS_LIMIT,
   DISCORD_EMBED_TOTAL_CHARS_LIMIT,
+  DISCORD_EMBEDS_PER_MESSAGE_LIMIT,
   LIVING_LANDS_LOGO_URL,
   KOFI_USERNAME,
   KOFI_URL,
 } from '../constants.js';
-import type { DiscordEmbed } from '../types/interfaces.js';
+import type {
+  AnnouncementContent,
+  ChangelogContent,
+  DiscordEmbed,
+  DiscordEmbedField,
+  TeaserContent,
+} from '../types/interfaces.js';
 
-// Color mapping (Discord uses decimal values)
-const STYLE_COLORS: Record<AnnouncementStyle, number> = {
-  [AnnouncementStyle.RELEASE]: 0x57F287,  // Green
-  [AnnouncementStyle.HOTFIX]: 0xED4245,   // Red
-  [AnnouncementStyle.BETA]: 0xFEE75C,     // Yellow
-  [AnnouncementStyle.CUSTOM]: 0x5865F2,   // Blurple
+// Per-style presets: sidebar color (Discord uses decimal values) and title emoji
+interface StylePreset {
+  color: number;
+  emoji: string;
+}
+
+const STYLE_PRESETS: Record<AnnouncementStyle, StylePreset> = {
+  [AnnouncementStyle.RELEASE]: { color: 0x57F287, emoji: '📦' },  // Green
+  [AnnouncementStyle.HOTFIX]: { color: 0xED4245, emoji: '🚨' },   // Red
+  [AnnouncementStyle.BETA]: { color: 0xFEE75C, emoji: '🧪' },     // Yellow
+  [AnnouncementStyle.CUSTOM]: { color: 0x5865F2, emoji: '📢' },   // Blurple
 };
 
-// Emoji mapping
-const STYLE_EMOJIS: Record<AnnouncementStyle, string> = {
-  [AnnouncementStyle.RELEASE]: '📦',
-  [AnnouncementStyle.HOTFIX]: '🚨',
-  [AnnouncementStyle.BETA]: '🧪',
-  [AnnouncementStyle.CUSTOM]: '📢',
+// Bullet prefixes for change/highlight lists and changelog items
+const ARROW_PREFIX = '→ ';
+const DASH_PREFIX = '- ';
+
+// Fixed lines of the plain-text announcement
+const BETA_NOTICE_LINE = '⚠️ Beta — back up your world before updating.';
+const LINK_PREFIX = '🔗 ';
+
+// Static embed subtrees shared across calls instead of rebuilt per embed
+const DEFAULT_THUMBNAIL = { url: LIVING_LANDS_LOGO_URL };
+const ANNOUNCEMENT_FOOTER = { text: 'Release Announcement' };
+const CHANGELOG_FOOTER = { text: 'Changelog' };
+
+const BETA_WARNING_FIELD: DiscordEmbedField = {
+  name: '⚠️ Warning',
+  value: 'This is a **beta release**. Back up your world before updating!',
+  inline: false,
 };
 
-export function buildAnnouncementEmbed(params: {
-  version: string;
-  headline: string;
-  changes: string[];
-  downloadUrl?: string;
-  style: AnnouncementStyle;
-  betaWarning: boolean;
-  embedColor?: string;
-  thumbnailUrl?: string;
-  footerText?: string;
-}): DiscordEmbed {
-  const color = parseColor(params.embedColor) ?? STYLE_COLORS[params.style];
-  const emoji = STYLE_EMOJIS[params.style];
-  
-  const embed: DiscordEmbed = {
-    title: `${emoji} ${params.version} is live!`,
-    description: params.headline,
-    color,
-    timestamp: new Date().toISOString(),
-    fields: [],
-  };
+// Donation field appended to announcement and teaser embeds
+const SUPPORT_FIELD: DiscordEmbedField = {
+  name: '☕ Support Development',
+  value: `Enjoying Living Lands Reloaded? Consider supporting development: [Ko-fi.com/${KOFI_USERNAME}](${KOFI_URL})`,
+  inline: false,
+};
+
+export function buildAnnouncementEmbed(params: AnnouncementContent): DiscordEmbed {
+  const preset = STYLE_PRESETS[params.style];
+  const color = params.embedColor ?? preset.color;
+  const emoji = preset.emoji;
   
-  // Add changes field
-  const changesText = params.changes.map(c => `→ ${c}`).join('\n');
-  embed.fields!.push({
+  // Changes field
+  const fields: DiscordEmbedField[] = [{
     name: 'What\'s New',
-    value: changesText,
+    value: bulletList(params.changes, ARROW_PREFIX),
     inline: false,
-  });
+  }];
   
   // Beta warning
   if (params.betaWarning) {
-    embed.fields!.push({
-      name: '⚠️ Warning',
-      value: 'This is a **beta release**. Back up your world before updating!',
-      inline: false,
-    });
+    fields.push(BETA_WARNING_FIELD);
   }
   
   // Download link
   if (params.downloadUrl) {
-    embed.url = params.downloadUrl;
-    embed.fields!.push({
+    fields.push({
       name: '🔗 Download',
       value: `[Get it here](${params.downloadUrl})`,
       inline: false,
@@ -79,52 +86,33 @@ export function buildAnnouncementEmbed(params: {
   }
   
   // Donation field
-  embed.fields!.push({
-    name: '☕ Support Development',
-    value: `Enjoying Living Lands Reloaded? Consider supporting development: [Ko-fi.com/${KOFI_USERNAME}](${KOFI_URL})`,
-    inline: false,
-  });
-  
-  // Thumbnail
-  embed.thumbnail = { url: params.thumbnailUrl ?? LIVING_LANDS_LOGO_URL };
-  
-  // Footer
-  embed.footer = { text: params.footerText ?? 'Release Announcement' };
-  
-  return embed;
-}
-
-export function buildTeaserEmbed(params: {
-  version: string;
-  headline: string;
-  highlights: string[];
-  additionalInfo?: string;
-  style: AnnouncementStyle;
-  embedColor?: string;
-  thumbnailUrl?: string;
-  footerText?: string;
-}): DiscordEmbed {
-  const color = parseColor(params.embedColor) ?? STYLE_COLORS[params.style];
+  fields.push(SUPPORT_FIELD);
   
-  const embed: DiscordEmbed = {
-    title: `👀 ${params.version} - ${params.headline}`,
-    description: 'Something exciting is on the way... 🌱',
+  return {
+    title: `${emoji} ${params.version} is live!`,
+    description: params.headline,
+    url: params.downloadUrl,
     color,
-    timestamp: new Date().toISOString(),
-    fields: [],
+    timestamp: params.timestamp ?? new Date().toISOString(),
+    fields,
+    thumbnail: params.thumbnailUrl ? { url: params.thumbnailUrl } : DEFAULT_THUMBNAIL,
+    footer: params.footerText ? { text: params.footerText } : ANNOUNCEMENT_FOOTER,
   };
+}
+
+export function buildTeaserEmbed(params: TeaserContent): DiscordEmbed {
+  const color = params.embedColor ?? STYLE_PRESETS[params.style].color;
   
   // Highlights
-  const highlightsText = params.highlights.map(h => `→ ${h}`).join('\n');
-  embed.fields!.push({
+  const fields: DiscordEmbedField[] = [{
     name: '✨ What to Expect',
-    value: highlightsText,
+    value: bulletList(params.highlights, ARROW_PREFIX),
     inline: false,
-  });
+  }];
   
   // Additional info
   if (params.additionalInfo) {
-    embed.fields!.push({
+    fields.push({
       name: '💡 More Info',
       value: params.additionalInfo,
       inline: false,
@@ -132,101 +120,86 @@ export function buildTeaserEmbed(params: {
   }
   
   // Donation field
-  embed.fields!.push({
-    name: '☕ Support Development',
-    value: `Enjoying Living Lands Reloaded? Consider supporting development: [Ko-fi.com/${KOFI_USERNAME}](${KOFI_URL})`,
-    inline: false,
-  });
-  
-  embed.thumbnail = { url: params.thumbnailUrl ?? LIVING_LANDS_LOGO_URL };
-  embed.footer = { text: params.footerText ?? `${params.version} • Coming Soon` };
+  fields.push(SUPPORT_FIELD);
   
-  return embed;
+  return {
+    title: `👀 ${params.version} - ${params.headline}`,
+    description: 'Something exciting is on the way... 🌱',
+    color,
+    timestamp: params.timestamp ?? new Date().toISOString(),
+    fields,
+    thumbnail: params.thumbnailUrl ? { url: params.thumbnailUrl } : DEFAULT_THUMBNAIL,
+    footer: { text: params.footerText ?? `${params.version} • Coming Soon` },
+  };
 }
 
-export function formatAnnouncement(params: {
-  version: string;
-  headline: string;
-  changes: string[];
-  downloadUrl?: string;
-  style: AnnouncementStyle;
-  betaWarning: boolean;
-}): string {
-  const emoji = STYLE_EMOJIS[params.style];
+export function formatAnnouncement(params: AnnouncementContent): string {
+  const emoji = STYLE_PRESETS[params.style].emoji;
   const lines: string[] = [
     `${emoji} **${params.version}** is live!`,
     '',
     params.headline,
     '',
+    bulletList(params.changes, ARROW_PREFIX),
+    ...(params.betaWarning ? ['', BETA_NOTICE_LINE] : []),
+    ...(params.downloadUrl ? [LINK_PREFIX + params.downloadUrl] : []),
   ];
   
-  params.changes.forEach(change => {
-    const prefix = change.startsWith('→') || change.startsWith('->') ? '' : '→ ';
-    lines.push(prefix + change.replace('->', '→'));
-  });
+  return lines.join('\n');
+}
+
+// Exact length of formatAnnouncement's output, computed without building it,
+// so oversized announcements can be rejected up front
+export function measureAnnouncement(params: AnnouncementContent): number {
+  const emoji = STYLE_PRESETS[params.style].emoji;
+  // Title line, blank line, headline, blank line (joined by newlines)
+  let length = emoji.length + ' **'.length + params.version.length + '** is live!'.length
+    + 2 + params.headline.length + 2;
   
-  if (params.betaWarning) {
-    lines.push('', '⚠️ Beta — back up your world before updating.');
+  for (const change of params.changes) {
+    length += ARROW_PREFIX.length + change.length;
   }
+  length += params.changes.length - 1;
   
-  if (params.downloadUrl) {
-    lines.push(`🔗 ${params.downloadUrl}`);
+  if (params.betaWarning) length += 2 + BETA_NOTICE_LINE.length;
+  if (params.downloadUrl) length += 1 + LINK_PREFIX.length + params.downloadUrl.length;
+  return length;
+}
+
+// Markdown preview of an embed's title, description and fields for tool output
+export function formatEmbedPreview(embed: DiscordEmbed): string {
+  let preview = `**${embed.title}**\n${embed.description ?? ''}\n`;
+  for (const field of embed.fields ?? []) {
+    preview += `\n**${field.name}**\n${field.value}\n`;
   }
-  
-  return lines.join('\n');
+  return preview;
 }
 
-export function buildChangelogEmbed(params: {
-  title: string;
-  sections: Array<{ title: string; items: string[] }>;
-  version?: string;
-  summary?: string;
-  url?: string;
-  style: AnnouncementStyle;
-  embedColor?: string;
-  thumbnailUrl?: string;
-  footerText?: string;
-}): DiscordEmbed {
-  const color = parseColor(params.embedColor) ?? STYLE_COLORS[params.style];
+export function buildChangelogEmbed(params: ChangelogContent): DiscordEmbed {
+  const color = params.embedColor ?? STYLE_PRESETS[params.style].color;
   const versionPrefix = params.version ? `${params.version} - ` : '';
 
-  const embed: DiscordEmbed = {
-    title: `${versionPrefix}${params.title}`,
-    description: params.summary,
-    color,
-    timestamp: new Date().toISOString(),
-    fields: [],
-  };
-
-  if (params.url) embed.url = params.url;
-
-  const availableFields = Math.min(params.sections.length, DISCORD_EMBED_FIELDS_LIMIT);
-  for (let i = 0; i < availableFields; i++) {
-    const section = params.sections[i]!;
-    const value = truncateEmbedFieldValue(section.items.map((it) => `- ${it}`).join('\n'));
-    embed.fields!.push({
+  const fields: DiscordEmbedField[] = params.sections
+    .slice(0, DISCORD_EMBED_FIELDS_LIMIT)
+    .map((section) => ({
       name: section.title,
-      value,
+      value: truncateEmbedFieldValue(bulletList(section.items, DASH_PREFIX)),
       inline: false,
-    });
-  }
-
-  // Thumbnail
-  embed.thumbnail = { url: params.thumbnailUrl ?? LIVING_LANDS_LOGO_URL };
-
-  // Footer
-  embed.footer = { text: params.footerText ?? 'Changelog' };
+    }));
 
-  return ensureEmbedTotalCharsLimit(embed);
+  return ensureEmbedTotalCharsLimit({
+    title: `${versionPrefix}${params.title}`,
+    description: params.summary,
+    url: params.url,
+    color,
+    timestamp: params.timestamp ?? new Date().toISOString(),
+    fields,
+    thumbnail: params.thumbnailUrl ? { url: params.thumbnailUrl } : DEFAULT_THUMBNAIL,
+    footer: params.footerText ? { text: params.footerText } : CHANGELOG_FOOTER,
+  });
 }
 
-export function formatChangelog(params: {
-  title: string;
-  sections: Array<{ title: string; items: string[] }>;
-  version?: string;
-  summary?: string;
-  url?: string;
-}): string {
+export function formatChangelog(params: ChangelogContent): string {
   const lines: string[] = [];
   lines.push(`**${params.version ? `${params.version} - ` : ''}${params.title}**`);
   if (params.summary) lines.push(params.summary);
@@ -244,13 +217,13 @@ export function formatChangelog(params: {
   return lines.join('\n').trimEnd();
 }
 
-function parseColor(hex?: string): number | null {
-  if (!hex) return null;
-  try {
-    return parseInt(hex.replace('#', ''), 16);
-  } catch {
-    return null;
+// Prefix each item and join with newlines without an intermediate array
+function bulletList(items: string[], prefix: string): string {
+  let text = '';
+  for (const item of items) {
+    text += text.length === 0 ? prefix + item : '\n' + prefix + item;
   }
+  return text;
 }
 
 function truncateEmbedFieldValue(value: string): string {
@@ -258,17 +231,59 @@ function truncateEmbedFieldValue(value: string): string {
   return value.slice(0, DISCORD_EMBED_FIELD_VALUE_LIMIT - 1) + '…';
 }
 
-function ensureEmbedTotalCharsLimit(embed: DiscordEmbed): DiscordEmbed {
-  // Rough enforcement of 6000-char total embed limit (Discord).
-  const parts: string[] = [];
-  if (embed.title) parts.push(embed.title);
-  if (embed.description) parts.push(embed.description);
+// Characters Discord counts toward the 6000-char embed limit
+export function countEmbedChars(embed: DiscordEmbed): number {
+  let total = (embed.title?.length ?? 0) + (embed.description?.length ?? 0);
   for (const f of embed.fields ?? []) {
-    parts.push(f.name, f.value);
+    total += f.name.length + f.value.length;
   }
-  if (embed.footer?.text) parts.push(embed.footer.text);
+  return total + (embed.footer?.text.length ?? 0);
+}
 
-  const total = parts.reduce((n, p) => n + p.length, 0);
+// Why Discord would reject this embed for its length, or null if it fits
+export function describeEmbedLimitViolation(embed: DiscordEmbed): string | null {
+  for (const field of embed.fields ?? []) {
+    if (field.value.length > DISCORD_EMBED_FIELD_VALUE_LIMIT) {
+      return `Embed field '${field.name}' is too long (${field.value.length} chars). Discord limit is ${DISCORD_EMBED_FIELD_VALUE_LIMIT} characters per field. Reduce the number of items or shorten them.`;
+    }
+  }
+  
+  const total = countEmbedChars(embed);
+  if (total > DISCORD_EMBED_TOTAL_CHARS_LIMIT) {
+    return `Embed is too long (${total} chars). Discord limit is ${DISCORD_EMBED_TOTAL_CHARS_LIMIT} characters per embed. Shorten the text.`;
+  }
+  return null;
+}
+
+// Split embeds into as few webhook messages as possible. The 6000-char limit
+// applies to all embeds of a message combined, as does the 10-embed cap.
+export function groupEmbedsForMessages(embeds: DiscordEmbed[]): DiscordEmbed[][] {
+  const groups: DiscordEmbed[][] = [];
+  let current: DiscordEmbed[] = [];
+  let currentChars = 0;
+  
+  for (const embed of embeds) {
+    const chars = countEmbedChars(embed);
+    if (
+      current.length > 0 &&
+      (current.length >= DISCORD_EMBEDS_PER_MESSAGE_LIMIT ||
+        currentChars + chars > DISCORD_EMBED_TOTAL_CHARS_LIMIT)
+    ) {
+      groups.push(current);
+      current = [];
+      currentChars = 0;
+    }
+    current.push(embed);
+    currentChars += chars;
+  }
+  
+  if (current.length > 0) groups.push(current);
+  return groups;
+}
+
+function ensureEmbedTotalCharsLimit(embed: DiscordEmbed): DiscordEmbed {
+  // Rough enforcement of 6000-char total embed limit (Discord).
+  const total = countEmbedChars(embed);
   if (total <= DISCORD_EMBED_TOTAL_CHARS_LIMIT) return embed;
 
   const over = total - DISCORD_EMBED_TOTAL_CHARS_LIMIT;
@@ -2,40 +2,106 @@
  * Webhook storage management using JSON files
  */
 
-import { mkdir, readFile, writeFile } from 'fs/promises';
-import { existsSync } from 'fs';
+import { randomUUID } from 'crypto';
+import { mkdir, readFile, rename, rm, stat, writeFile } from 'fs/promises';
+import type { BigIntStats } from 'fs';
 import { CONFIG_DIR, WEBHOOKS_FILE } from '../constants.js';
 import type { WebhookStorage } from '../types/interfaces.js';
 
+// Parsed webhooks.json, reused until the file's mtime or size changes.
+// Resolved name -> URL lookups live on the entry so they are dropped with it.
+interface WebhooksCache {
+  mtimeNs: bigint;
+  size: bigint;
+  webhooks: WebhookStorage;
+  urls: Map<string, string | null>;
+}
+
+let webhooksCache: WebhooksCache | null = null;
+
+// Created on write; reads treat a missing directory as no webhooks. Called on
+// every save (a no-op when the directory exists) so a directory removed while
+// the server runs is recreated instead of failing saves until restart.
 export async function ensureConfigDir(): Promise<void> {
-  if (!existsSync(CONFIG_DIR)) {
-    await mkdir(CONFIG_DIR, { recursive: true });
-  }
+  await mkdir(CONFIG_DIR, { recursive: true });
 }
 
-export async function loadWebhooks(): Promise<WebhookStorage> {
-  await ensureConfigDir();
+async function readWebhooks(): Promise<WebhooksCache | null> {
+  let stats: BigIntStats;
+  try {
+    stats = await stat(WEBHOOKS_FILE, { bigint: true });
+  } catch (error) {
+    webhooksCache = null;
+    if ((error as NodeJS.ErrnoException).code !== 'ENOENT') {
+      console.error('Failed to load webhooks:', error);
+    }
+    return null;
+  }
   
-  if (!existsSync(WEBHOOKS_FILE)) {
-    return {};
+  if (
+    webhooksCache &&
+    webhooksCache.mtimeNs === stats.mtimeNs &&
+    webhooksCache.size === stats.size
+  ) {
+    return webhooksCache;
   }
   
   try {
-    const content = await readFile(WEBHOOKS_FILE, 'utf-8');
-    return JSON.parse(content);
+    // Entries were validated by addWebhookInputSchema when they were written,
+    // so they are trusted here and not re-parsed through webhookConfigSchema.
+    // Size is already known from stat, so an empty file needs no read at all.
+    const webhooks: WebhookStorage = stats.size === 0n
+      ? {}
+      : JSON.parse(await readFile(WEBHOOKS_FILE, 'utf-8'));
+    webhooksCache = { mtimeNs: stats.mtimeNs, size: stats.size, webhooks, urls: new Map() };
+    return webhooksCache;
   } catch (error) {
     console.error('Failed to load webhooks:', error);
-    return {};
+    return null;
   }
 }
 
+export async function loadWebhooks(): Promise<WebhookStorage> {
+  const cache = await readWebhooks();
+  // Shallow copy so callers can add/delete entries without touching the cache
+  return cache ? { ...cache.webhooks } : {};
+}
+
 export async function saveWebhooks(webhooks: WebhookStorage): Promise<void> {
   await ensureConfigDir();
-  await writeFile(WEBHOOKS_FILE, JSON.stringify(webhooks, null, 2), 'utf-8');
+  const data = JSON.stringify(webhooks, null, 2);
+  // Write to a temp file unique to this call and rename so readers never see a
+  // partial file; concurrent saves (in this process or another) never share a
+  // temp path, so one save's rename or cleanup cannot touch another's file
+  const tmpFile = `${WEBHOOKS_FILE}.${process.pid}.${randomUUID()}.tmp`;
+  try {
+    await writeFile(tmpFile, data, 'utf-8');
+    await rename(tmpFile, WEBHOOKS_FILE);
+  } catch (error) {
+    await rm(tmpFile, { force: true });
+    throw error;
+  } finally {
+    webhooksCache = null;
+  }
 }
 
-export async function getWebhookUrl(name: string): Promise<string | null> {
-  const webhooks = await loadWebhooks();
-  const webhook = webhooks[name.toLowerCase()];
-  return webhook?.url ?? null;
+// Resolve a webhook name to its URL from a single read of webhooks.json. The
+// not-found error lists the configured names from that same read.
+export async function resolveWebhookUrl(name: string): Promise<string> {
+  const cache = await readWebhooks();
+  
+  let url = cache?.urls.get(name);
+  if (cache && url === undefined) {
+    url = cache.webhooks[name.toLowerCase()]?.url ?? null;
+    cache.urls.set(name, url);
+  }
+  if (url) return url;
+  
+  const available = cache ? Object.keys(cache.webhooks) : [];
+  const configured = available.length > 0
+    ? `Available webhooks: ${available.join(', ')}.`
+    : 'No webhooks configured.';
+  throw new Error(
+    `Webhook '${name}' not found. ${configured} Use discord_add_webhook to add a webhook named '${name}'.`
+  );
 }
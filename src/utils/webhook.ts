@@ -1,47 +1,263 @@
 /**
- * Discord webhook HTTP operations using axios
+ * Discord webhook HTTP operations using the runtime's native fetch
  */
 
-import axios, { AxiosError } from 'axios';
+import { createHash } from 'crypto';
+import { setTimeout as sleep } from 'timers/promises';
+import {
+  HTTP_TIMEOUT_MS,
+  WEBHOOK_DEDUPE_WINDOW_MS,
+  WEBHOOK_MAX_RETRIES,
+  WEBHOOK_MAX_RETRY_DELAY_MS,
+  WEBHOOK_RATE_LIMIT_REQUESTS,
+  WEBHOOK_RATE_LIMIT_WINDOW_MS,
+  WEBHOOK_RETRY_BASE_DELAY_MS,
+  WEBHOOK_RETRY_JITTER_MS,
+} from '../constants.js';
 import type { WebhookMessagePayload, WebhookResponse } from '../types/interfaces.js';
+import { describeNetworkError } from './errors.js';
 
-export async function sendWebhookMessage(
+const JSON_HEADERS = { 'Content-Type': 'application/json' };
+
+// Sliding-window pacing per webhook URL (Discord rate-limits per webhook
+// route), so bursts of tool calls pace themselves instead of running into
+// 429s. Sends to one URL are already serialized by sendQueues below.
+interface RateLimitState {
+  sentAt: number[];   // start times of the last WEBHOOK_RATE_LIMIT_REQUESTS sends
+  resetAt: number;    // set when Discord reports the bucket exhausted
+}
+
+const rateLimits = new Map<string, RateLimitState>();
+
+function getRateLimitState(webhookUrl: string): RateLimitState {
+  let state = rateLimits.get(webhookUrl);
+  if (!state) {
+    state = { sentAt: [], resetAt: 0 };
+    rateLimits.set(webhookUrl, state);
+  }
+  return state;
+}
+
+async function acquireSendSlot(webhookUrl: string): Promise<void> {
+  const state = getRateLimitState(webhookUrl);
+  
+  for (;;) {
+    const now = Date.now();
+    // Wait for Discord's reported reset, then until the oldest of the last
+    // WEBHOOK_RATE_LIMIT_REQUESTS sends has left the window
+    let wait = state.resetAt - now;
+    if (state.sentAt.length >= WEBHOOK_RATE_LIMIT_REQUESTS) {
+      wait = Math.max(wait, state.sentAt[0] + WEBHOOK_RATE_LIMIT_WINDOW_MS - now);
+    }
+    
+    if (wait <= 0) {
+      if (state.sentAt.length >= WEBHOOK_RATE_LIMIT_REQUESTS) state.sentAt.shift();
+      state.sentAt.push(now);
+      return;
+    }
+    await sleep(wait);
+  }
+}
+
+// Follow Discord's own bucket: when a response says no requests remain, hold
+// the next send until the bucket resets
+function recordRateLimitHeaders(webhookUrl: string, response: Response): void {
+  if (response.headers.get('X-RateLimit-Remaining') !== '0') return;
+  const resetAfter = Number.parseFloat(response.headers.get('X-RateLimit-Reset-After') ?? '');
+  if (Number.isFinite(resetAfter)) {
+    getRateLimitState(webhookUrl).resetAt = Date.now() + resetAfter * 1000;
+  }
+}
+
+// Content hash of recent successful sends -> time sent. MCP clients sometimes
+// re-invoke a tool after a slow response; with the dedupe option, an identical
+// payload to the same webhook within the window is not posted twice.
+const recentSends = new Map<string, number>();
+
+function getSendKey(webhookUrl: string, payload: WebhookMessagePayload): string {
+  // Embed timestamps differ between otherwise identical calls, so leave them out
+  const content = JSON.stringify(payload, (key, value) =>
+    key === 'timestamp' ? undefined : value
+  );
+  return createHash('sha256').update(webhookUrl).update('\n').update(content).digest('hex');
+}
+
+function isRecentSend(key: string): boolean {
+  const sentAt = recentSends.get(key);
+  return sentAt !== undefined && Date.now() - sentAt < WEBHOOK_DEDUPE_WINDOW_MS;
+}
+
+function rememberSend(key: string): void {
+  const now = Date.now();
+  // Entries are kept in send order, so expired ones are all at the front
+  for (const [oldKey, sentAt] of recentSends) {
+    if (now - sentAt < WEBHOOK_DEDUPE_WINDOW_MS) break;
+    recentSends.delete(oldKey);
+  }
+  recentSends.delete(key);
+  recentSends.set(key, now);
+}
+
+// Tail of the pending sends per webhook URL. Sends to one webhook run one at a
+// time in call order, so a send waiting out a 429 holds back the ones behind it
+// instead of letting them race into the same limit, and messages land in the
+// channel in the order the tools were called.
+const sendQueues = new Map<string, Promise<WebhookResponse>>();
+
+export interface SendOptions {
+  // Skip the send (returning deduped: true) if an identical payload went to
+  // this webhook within WEBHOOK_DEDUPE_WINDOW_MS. Used by the announcement
+  // tools; plain messages may legitimately repeat.
+  dedupe?: boolean;
+}
+
+export function sendWebhookMessage(
+  webhookUrl: string,
+  payload: WebhookMessagePayload,
+  options: SendOptions = {}
+): Promise<WebhookResponse> {
+  const previous = sendQueues.get(webhookUrl);
+  const result = previous
+    ? previous.then(() => postWebhookMessage(webhookUrl, payload, options))
+    : postWebhookMessage(webhookUrl, payload, options);
+  sendQueues.set(webhookUrl, result);
+  
+  // Forget the queue once it drains so idle webhooks hold no entry
+  const release = () => {
+    if (sendQueues.get(webhookUrl) === result) sendQueues.delete(webhookUrl);
+  };
+  result.then(release, release);
+  return result;
+}
+
+// postWebhookMessage never rejects: every failure becomes a WebhookResponse
+async function postWebhookMessage(
   webhookUrl: string,
-  payload: WebhookMessagePayload
+  payload: WebhookMessagePayload,
+  options: SendOptions
 ): Promise<WebhookResponse> {
   try {
-    const response = await axios.post(webhookUrl, payload, {
-      headers: { 'Content-Type': 'application/json' },
-      timeout: 30000,
-      validateStatus: (status) => status >= 200 && status < 300,
-    });
+    // Checked here rather than before queueing so a duplicate waiting behind
+    // the original send sees its result
+    const sendKey = options.dedupe ? getSendKey(webhookUrl, payload) : null;
+    if (sendKey && isRecentSend(sendKey)) {
+      return {
+        success: true,
+        message: `An identical message was sent to this webhook in the last ${WEBHOOK_DEDUPE_WINDOW_MS / 1000} seconds, so it was not posted again.`,
+        deduped: true,
+      };
+    }
     
-    return {
-      success: true,
-      statusCode: response.status,
-      message: 'Message sent successfully',
-      response: response.data,
-    };
+    const body = JSON.stringify(payload);
+    
+    for (let attempt = 0; ; attempt++) {
+      await acquireSendSlot(webhookUrl);
+      
+      // fetch draws from the runtime's keep-alive connection pool, so repeated
+      // sends to discord.com reuse connections without a client object to manage
+      const response = await fetch(webhookUrl, {
+        method: 'POST',
+        headers: JSON_HEADERS,
+        body,
+        signal: AbortSignal.timeout(HTTP_TIMEOUT_MS),
+      });
+      recordRateLimitHeaders(webhookUrl, response);
+      
+      if (response.ok) {
+        if (sendKey) rememberSend(sendKey);
+        return await buildSuccessResponse(response);
+      }
+      
+      const errorBody = parseResponseBody(await response.text());
+      const retryDelay = attempt < WEBHOOK_MAX_RETRIES
+        ? getRetryDelay(response, errorBody, attempt)
+        : null;
+      if (retryDelay !== null) {
+        await sleep(retryDelay);
+        continue;
+      }
+      
+      const detail = extractDiscordMessage(errorBody);
+      const error = extractErrorMessage(response.status);
+      return {
+        success: false,
+        statusCode: response.status,
+        error: detail ? `${error} Discord says: ${detail}` : error,
+      };
+    }
   } catch (error) {
-    if (axios.isAxiosError(error)) {
-      const axiosError = error as AxiosError;
+    if (error instanceof Error) {
       return {
         success: false,
-        statusCode: axiosError.response?.status,
-        error: extractErrorMessage(axiosError),
+        error: describeNetworkError(error) ?? error.message,
       };
     }
     
     return {
       success: false,
-      error: error instanceof Error ? error.message : 'Unknown error',
+      error: 'Unknown error',
     };
   }
 }
 
-function extractErrorMessage(error: AxiosError): string {
-  const status = error.response?.status;
+async function buildSuccessResponse(response: Response): Promise<WebhookResponse> {
+  return {
+    success: true,
+    statusCode: response.status,
+    message: 'Message sent successfully',
+    // Discord answers 204 No Content unless ?wait=true, so skip the read
+    response: response.status === 204
+      ? undefined
+      : parseResponseBody(await response.text()),
+  };
+}
+
+// Delay before retrying a failed send, or null if the failure is final.
+// 429s follow Discord's Retry-After hint; 5xx back off exponentially. Random
+// jitter keeps concurrent retries from landing in the same instant.
+function getRetryDelay(response: Response, body: unknown, attempt: number): number | null {
+  let delay: number;
+  if (response.status === 429) {
+    // Retry-After header, else the retry_after field of the JSON body (both seconds)
+    const header = Number.parseFloat(response.headers.get('Retry-After') ?? '');
+    const seconds = Number.isFinite(header) ? header : extractRetryAfter(body) ?? 1;
+    delay = seconds * 1000;
+  } else if (response.status >= 500) {
+    delay = WEBHOOK_RETRY_BASE_DELAY_MS * 2 ** attempt;
+  } else {
+    return null;
+  }
   
+  // Long waits (e.g. a global rate limit) are reported instead of blocking the tool call
+  if (delay > WEBHOOK_MAX_RETRY_DELAY_MS) return null;
+  return delay + Math.random() * WEBHOOK_RETRY_JITTER_MS;
+}
+
+function extractRetryAfter(body: unknown): number | null {
+  if (typeof body === 'object' && body !== null && 'retry_after' in body) {
+    return typeof body.retry_after === 'number' ? body.retry_after : null;
+  }
+  return null;
+}
+
+function parseResponseBody(body: string): unknown {
+  if (!body) return undefined;
+  try {
+    return JSON.parse(body);
+  } catch {
+    return body;
+  }
+}
+
+// Discord error bodies look like { "message": "...", "code": 50006 }
+function extractDiscordMessage(body: unknown): string | null {
+  if (typeof body === 'object' && body !== null && 'message' in body) {
+    return typeof body.message === 'string' ? body.message : null;
+  }
+  return typeof body === 'string' && body.length > 0 ? body : null;
+}
+
+function extractErrorMessage(status: number): string {
   switch (status) {
     case 400:
       return 'Bad request. Check that the message content is valid and within Discord limits.';